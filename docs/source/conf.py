@@ -15,11 +15,9 @@ release = '0.3.1'
 # https://www.sphinx-doc.org/en/master/usage/configuration.html#general-configuration
 
 extensions = [
-    'sphinx.ext.autodoc',
-    'sphinx.ext.autosummary',
+    'autoapi.extension',
     'sphinx_rtd_theme',
 ]
-autosummary_generate = True
 
 templates_path = ['_templates']
 exclude_patterns = []
@@ -30,12 +28,20 @@ exclude_patterns = []
 html_theme = 'sphinx_rtd_theme'
 html_static_path = ['_static']
 add_module_names = False
-autodoc_mock_imports = ['requests', "requests_oauthlib"]
-
-autodoc_default_options = {
-    'members': True,
-    'member-order': "bysource",
-}
 python_use_unqualified_type_names = True
-autosummary_ignore_module_all = False
-autosummary_imported_members = True
+
+# -- Options for AutoAPI -----------------------------------------------------
+# https://sphinx-autoapi.readthedocs.io/en/latest/reference/config.html
+# Sources are parsed statically, so nothing is imported during the build.
+
+autoapi_dirs = ['../../src']
+autoapi_root = 'api'
+autoapi_add_toctree_entry = False
+autoapi_keep_files = True
+autoapi_member_order = 'bysource'
+autoapi_options = [
+    'members',
+    'undoc-members',
+    'show-inheritance',
+    'show-module-summary',
+]
@@ -1,22 +1,47 @@
 """
 Provides classes to interact with blogs, and create post content.
+
+Submodules are imported lazily on first attribute access so that
+``import tumblr`` does not pay for ``requests`` until it is needed.
 """
 
-from .tumblr import Tumblr, User, Blog
-from .content import (
-    Text,
-    Heading,
-    Subheading,
-    Chat,
-    Quote,
-    Cursive,
-    OrderedList,
-    UnorderedList,
-    OrderedListItem,
-    UnorderedListItem,
-    ReadMore,
-    Indented,
-    Poll,
-    Image,
-    Row,
-)
+import importlib
+
+__all__ = [
+    "Tumblr",
+    "User",
+    "Blog",
+    "Text",
+    "Heading",
+    "Subheading",
+    "Chat",
+    "Quote",
+    "Cursive",
+    "OrderedList",
+    "UnorderedList",
+    "OrderedListItem",
+    "UnorderedListItem",
+    "ReadMore",
+    "Indented",
+    "Poll",
+    "Image",
+    "Row",
+]
+
+_SUBMODULES = frozenset({"tumblr", "content"})
+_TUMBLR_ATTRS = frozenset({"Tumblr", "User", "Blog"})
+
+
+def __getattr__(name):
+    if name in _SUBMODULES:
+        return importlib.import_module(f".{name}", __name__)
+    if name not in __all__:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    module = "tumblr" if name in _TUMBLR_ATTRS else "content"
+    value = getattr(importlib.import_module(f".{module}", __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__) | _SUBMODULES)
@@ -2,12 +2,12 @@
 Provides several content blocks to make up post bodies
 """
 
-import abc
-from collections.abc import Iterable, Mapping
+import os
+import threading
+from collections.abc import Iterable, Iterator
 from datetime import timedelta
-from io import BytesIO
 from pathlib import PurePath
-from uuid import uuid4
+from typing import Any
 from pprint import PrettyPrinter
 
 __all__ = [
@@ -34,53 +34,75 @@ __all__ = [
 ]
 
 
-class Block(abc.ABC):
+class Block:
     """Abstract base class of content blocks"""
 
+    __slots__ = ()
+
     def __repr__(self):
-        values = ', '.join(f"{k}={v!r}" for k, v in self.__dict__.items())
+        values = ', '.join(f"{k}={v!r}" for k, v in _attributes(self))
         return f"{type(self).__name__}({values})"
 
 
-class ContentBlock(Block, abc.ABC):
+class ContentBlock(Block):
     """Abstract base class of normal text content blocks"""
 
-    @abc.abstractmethod
-    def data(self) -> Mapping:
+    __slots__ = ()
+
+    def data(self) -> dict:
         """The data associated with this block"""
+        raise NotImplementedError
 
 
-class MultiBlock(Block, abc.ABC):
+class MultiBlock(Block):
     """Abstract base class of container blocks"""
 
-    @abc.abstractmethod
-    def data(self) -> Iterable[Mapping]:
+    __slots__ = ()
+
+    def data(self) -> list[dict]:
         """The data associated with this block's children"""
+        raise NotImplementedError
 
 
-class DataBlock(Block, abc.ABC):
+class DataBlock(Block):
     """Abstract base class of content blocks that link to data"""
 
+    __slots__ = ("path", "mime_type", "fid")
+
     def __init__(self, path: PurePath | str, mime_type: str):
         self.path = path
         self.mime_type = mime_type
-        self.fid = str(uuid4())
+        self.fid = _next_fid()
+
+    def data(self) -> dict:
+        """The data associated with this block"""
+        raise NotImplementedError
 
     def file(self):
-        with open(self.path, "rb") as f:
-            byte_data = BytesIO(f.read())
-        return {self.fid: (self.fid, byte_data, self.mime_type)}
+        """
+        Opens the linked file for upload. The returned handle is streamed
+        by requests and must be closed by the caller once sent.
+        """
+        return {self.fid: (self.fid, open(self.path, "rb"), self.mime_type)}
 
 
 class RawText(ContentBlock):
     """Raw text block - creates text with the specified subtype"""
 
+    __slots__ = ("content", "subtype", "kwargs")
+
     def __init__(self, content: str, subtype: str, **kwargs):
         self.content = content
         self.subtype = subtype
         self.kwargs = kwargs
 
-    def data(self) -> Mapping:
+    def data(self) -> dict:
+        if not self.kwargs:
+            return {
+                "type": "text",
+                "text": self.content,
+                "subtype": self.subtype,
+            }
         return {
             "type": "text",
             "text": self.content,
@@ -96,11 +118,15 @@ class Text(ContentBlock):
     See: https://www.tumblr.com/docs/npf#content-block-type-text
     """
 
+    __slots__ = ("content", "kwargs")
+
     def __init__(self, content: str, **kwargs):
         self.content = content
         self.kwargs = kwargs
 
-    def data(self):
+    def data(self) -> dict:
+        if not self.kwargs:
+            return {"type": "text", "text": self.content}
         return {
             "type": "text",
             "text": self.content,
@@ -115,6 +141,8 @@ class Heading(RawText):
     See: https://www.tumblr.com/docs/npf#content-block-type-text
     """
 
+    __slots__ = ()
+
     def __init__(self, content: str, **kwargs):
         super().__init__(content, "heading1", **kwargs)
 
@@ -126,6 +154,8 @@ class Subheading(RawText):
     See: https://www.tumblr.com/docs/npf#content-block-type-text
     """
 
+    __slots__ = ()
+
     def __init__(self, content: str, **kwargs):
         super().__init__(content, "heading2", **kwargs)
 
@@ -137,6 +167,8 @@ class Cursive(RawText):
     See: https://www.tumblr.com/docs/npf#content-block-type-text
     """
 
+    __slots__ = ()
+
     def __init__(self, content: str, **kwargs):
         super().__init__(content, "quirky", **kwargs)
 
@@ -148,6 +180,8 @@ class Quote(RawText):
     See: https://www.tumblr.com/docs/npf#content-block-type-text
     """
 
+    __slots__ = ()
+
     def __init__(self, content: str, **kwargs):
         super().__init__(content, "quote", **kwargs)
 
@@ -159,6 +193,8 @@ class Indented(RawText):
     See: https://www.tumblr.com/docs/npf#content-block-type-text
     """
 
+    __slots__ = ()
+
     def __init__(self, content: str, **kwargs):
         super().__init__(content, "indented", **kwargs)
 
@@ -170,6 +206,8 @@ class Chat(RawText):
     See: https://www.tumblr.com/docs/npf#content-block-type-text
     """
 
+    __slots__ = ()
+
     def __init__(self, content: str, **kwargs):
         super().__init__(content, "chat", **kwargs)
 
@@ -182,6 +220,8 @@ class OrderedListItem(RawText):
     See: https://www.tumblr.com/docs/npf#content-block-type-text
     """
 
+    __slots__ = ()
+
     def __init__(self, content: str, **kwargs):
         super().__init__(content, "ordered-list-item", **kwargs)
 
@@ -194,6 +234,8 @@ class UnorderedListItem(RawText):
     See: https://www.tumblr.com/docs/npf#content-block-type-text
     """
 
+    __slots__ = ()
+
     def __init__(self, content: str, **kwargs):
         super().__init__(content, "unordered-list-item", **kwargs)
 
@@ -205,11 +247,23 @@ class OrderedList(MultiBlock):
     individual list item.
     """
 
+    __slots__ = ("items", "kwargs")
+
     def __init__(self, items: list[str], **kwargs):
-        self.items = [OrderedListItem(item, **kwargs) for item in items]
+        self.items = list(items)
+        self.kwargs = kwargs
 
-    def data(self):
-        yield from (item.data() for item in self.items)
+    def data(self) -> list[dict]:
+        subtype = "ordered-list-item"
+        if not self.kwargs:
+            return [
+                {"type": "text", "text": item, "subtype": subtype}
+                for item in self.items
+            ]
+        return [
+            {"type": "text", "text": item, "subtype": subtype, **self.kwargs}
+            for item in self.items
+        ]
 
 
 class UnorderedList(MultiBlock):
@@ -219,11 +273,23 @@ class UnorderedList(MultiBlock):
     individual list item.
     """
 
+    __slots__ = ("items", "kwargs")
+
     def __init__(self, items: list[str], **kwargs):
-        self.items = [UnorderedListItem(item, **kwargs) for item in items]
+        self.items = list(items)
+        self.kwargs = kwargs
 
-    def data(self):
-        yield from (item.data() for item in self.items)
+    def data(self) -> list[dict]:
+        subtype = "unordered-list-item"
+        if not self.kwargs:
+            return [
+                {"type": "text", "text": item, "subtype": subtype}
+                for item in self.items
+            ]
+        return [
+            {"type": "text", "text": item, "subtype": subtype, **self.kwargs}
+            for item in self.items
+        ]
 
 
 class Poll(ContentBlock):
@@ -244,6 +310,8 @@ class Poll(ContentBlock):
         (default 7 days)
     """
 
+    __slots__ = ("question", "options", "expire_after")
+
     def __init__(
           self,
           question: str,
@@ -255,12 +323,12 @@ class Poll(ContentBlock):
         self.options = options
         self.expire_after = expire_after
 
-    def data(self) -> Mapping:
+    def data(self) -> dict:
         return {
             "type": "poll",
             "question": self.question,
             # client_id must be provided in request but is now ignored by Tumblr
-            "client_id": str(uuid4()),
+            "client_id": _random_uuids(1)[0],
             "answers": [
                 {"answer_text": answer}
                 for answer in self.options
@@ -284,6 +352,8 @@ class Image(DataBlock):
     :param caption: Optional Caption (displayed under image when viewed)
     """
 
+    __slots__ = ("alt_text", "caption")
+
     def __init__(
           self,
           path: PurePath | str,
@@ -295,7 +365,7 @@ class Image(DataBlock):
         self.alt_text = alt_text
         self.caption = caption
 
-    def data(self) -> Mapping:
+    def data(self) -> dict:
         return {
             "type": "image",
             "media": [{"type": self.mime_type, "identifier": self.fid}],
@@ -312,6 +382,8 @@ class ReadMore(Block):
     See: https://www.tumblr.com/docs/npf#read-more
     """
 
+    __slots__ = ()
+
 
 class Row(Block):
     """
@@ -320,11 +392,70 @@ class Row(Block):
     :param images: varargs of Image blocks.
     """
 
+    __slots__ = ("images",)
+
     def __init__(self, *images: Image):
         self.images = images
 
-    def data(self) -> Iterable[Mapping]:
-        yield from (image.data() for image in self.images)
+    def data(self) -> list[dict]:
+        return [image.data() for image in self.images]
+
+
+def _random_uuids(n: int) -> list[str]:
+    """
+    Returns n random (version 4) UUID strings drawn from a single
+    os.urandom call, without building intermediate UUID objects.
+    """
+    raw = bytearray(os.urandom(16 * n))
+    raw[6::16] = bytes(b & 0x0F | 0x40 for b in raw[6::16])
+    raw[8::16] = bytes(b & 0x3F | 0x80 for b in raw[8::16])
+    h = raw.hex()
+    return [
+        f"{h[i:i + 8]}-{h[i + 8:i + 12]}-{h[i + 12:i + 16]}-"
+        f"{h[i + 16:i + 20]}-{h[i + 20:i + 32]}"
+        for i in range(0, 32 * n, 32)
+    ]
+
+
+_FID_POOL: list[str] = []
+_FID_POOL_LOCK = threading.Lock()
+
+
+def _next_fid() -> str:
+    """Hands out file identifiers from a pool refilled in batches of 64"""
+    with _FID_POOL_LOCK:
+        if not _FID_POOL:
+            _FID_POOL.extend(_random_uuids(64))
+        return _FID_POOL.pop()
+
+
+_SPECIAL_SLOTS = frozenset({"__dict__", "__weakref__"})
+_UNSET = object()
+
+
+def _attributes(block: Block) -> Iterator[tuple[str, Any]]:
+    """
+    Yields the (name, value) pairs stored in a block's slots and instance
+    dict. The __dict__ and __weakref__ slots and unset slots are skipped.
+    """
+    for cls in reversed(type(block).__mro__):
+        slots = cls.__dict__.get("__slots__", ())
+        for name in (slots,) if isinstance(slots, str) else slots:
+            if name in _SPECIAL_SLOTS:
+                continue
+            value = getattr(block, _mangle(cls, name), _UNSET)
+            if value is not _UNSET:
+                yield name, value
+    yield from getattr(block, "__dict__", {}).items()
+
+
+def _mangle(cls: type, name: str) -> str:
+    """The attribute name a slot declared in cls is stored under"""
+    if name.startswith("__") and not name.endswith("__"):
+        owner = cls.__name__.lstrip("_")
+        if owner:
+            return f"_{owner}{name}"
+    return name
 
 
 # noinspection PyUnresolvedReferences,PyProtectedMember,PyMethodMayBeStatic
@@ -339,13 +470,10 @@ class _BlockPrettyPrinter(PrettyPrinter):
     def _pprint_block(self, obj, stream, indent, *args):
         stream.write(f"{type(obj).__name__}(")
         indent += (len(type(obj).__name__) + 1)
-        items = iter(obj.__dict__.items())
-        k, v = next(items)
-        stream.write(f"{k}=")
-        self._format(v, stream, indent + len(k) + 1, *args)
-        for k, v in items:
-            stream.write(f"\n{' ' * indent}{k}=")
+        for i, (k, v) in enumerate(_attributes(obj)):
+            stream.write(f"\n{' ' * indent}{k}=" if i else f"{k}=")
             self._format(v, stream, indent + len(k) + 1, *args)
         stream.write(f")")
 
-    PrettyPrinter._dispatch[Block.__repr__] = _pprint_block
+
+PrettyPrinter._dispatch[Block.__repr__] = _BlockPrettyPrinter._pprint_block
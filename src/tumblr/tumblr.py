@@ -4,29 +4,51 @@ endpoints outlined in the Tumblr API documentation:
 https://www.tumblr.com/docs/en/api/v2
 """
 
-import json
-from collections.abc import Iterable
-from copy import deepcopy
+import threading
+import time
+from collections import OrderedDict, deque
+from collections.abc import Callable, Iterable, Iterator, Sequence
+from contextlib import ExitStack, contextmanager, nullcontext
 from dataclasses import dataclass
-from io import StringIO
+from functools import cache, lru_cache
 from types import MappingProxyType
-from typing import Any, Mapping
-from urllib.parse import quote_plus
+from typing import Any, BinaryIO, Mapping
+from urllib.parse import quote, quote_plus
 
 import requests
+from requests.adapters import HTTPAdapter
 from requests_oauthlib import OAuth1
+from urllib3.util import Retry
 
 from tumblr.content import *
 
+try:
+    import orjson
+
+    _loads = orjson.loads
+    _dumps = orjson.dumps
+except ImportError:
+    import json
+
+    _loads = json.loads
+
+    def _dumps(obj: Any) -> bytes:
+        return json.dumps(obj).encode()
+
+try:
+    from requests_toolbelt import MultipartEncoder
+except ImportError:
+    MultipartEncoder = None
+
 __all__ = ["Tumblr", "User", "Blog"]
 
-OPTIONAL_BLOG_FIELDS = (
+OPTIONAL_BLOG_FIELDS = frozenset({
     "is_following_you",
     "duration_blog_following_you",
     "duration_following_blog",
     "timezone",
     "timezone_offset",
-)
+})
 
 StrMap = Mapping[str, Any]
 
@@ -34,7 +56,20 @@ BASE_URL = "https://api.tumblr.com/v2"
 BLOG_URL = f"{BASE_URL}/blog"
 USER_URL = f"{BASE_URL}/user"
 
-mapping = MappingProxyType({})
+POOL_CONNECTIONS = 10
+POOL_MAXSIZE = 20
+
+POST_CACHE_SIZE = 128
+POST_CACHE_TTL = 30  # seconds
+
+RESPONSE_CACHE_SIZE = 256
+STREAM_CHUNK_SIZE = 64 * 1024
+MAX_PAGE_SIZE = 20
+
+_JSON_HEADERS = MappingProxyType({"Content-Type": "application/json"})
+
+_NPF_FORMAT = MappingProxyType({"npf": True})
+_NO_BLOG_FIELDS = MappingProxyType({})
 
 
 class Tumblr:
@@ -48,6 +83,15 @@ class Tumblr:
     Provides methods for the following endpoints:
         * /tagged – Get Posts with Tag
 
+    Requests are made through a single session so connections are kept
+    alive between calls. Idempotent requests that fail with a connection
+    error, 429, or 5xx status are retried up to three times with backoff.
+    Call :meth:`close` (or use the object as a context manager) to release
+    the connections. Responses from endpoints that rarely change (user and
+    blog info, followers, filtered tags and content, and avatars) are kept
+    when they carry an ETag or Last-Modified header and are revalidated on
+    later requests, so unchanged resources are not downloaded again.
+
     :param client_key: AKA Consumer Key
     :param client_secret: AKA Consumer Secret
     :param oauth_key: AKA Token
@@ -62,6 +106,34 @@ class Tumblr:
           oauth_secret: str,
     ):
         self._auth = OAuth1(client_key, client_secret, oauth_key, oauth_secret)
+        self._session = requests.Session()
+        self._session.auth = self._auth
+        self._session.mount("https://", HTTPAdapter(
+            pool_connections=POOL_CONNECTIONS,
+            pool_maxsize=POOL_MAXSIZE,
+            max_retries=Retry(
+                total=3,
+                backoff_factor=0.3,
+                status_forcelist=(429, 500, 502, 503, 504),
+                raise_on_status=False,
+            ),
+        ))
+        self._post_cache = OrderedDict()
+        self._post_cache_lock = threading.RLock()
+        self._response_cache = OrderedDict()
+        self._response_cache_lock = threading.Lock()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def close(self):
+        """
+        Closes the underlying HTTP session and any pooled connections.
+        """
+        self._session.close()
 
     def tagged(
           self,
@@ -90,42 +162,160 @@ class Tumblr:
             }
         )
 
-    def _get(self, url: str, params: Mapping = mapping):
-        request = requests.get(url=url, auth=self._auth, params=params)
-        request.raise_for_status()
-        return request.json()
+    def _get_post_cached(self, post_id: str | int, blog: str) -> StrMap:
+        """
+        Retrieves a post in NPF, reusing a response fetched less than
+        POST_CACHE_TTL seconds ago. Only the POST_CACHE_SIZE most recently
+        used posts are kept.
+        """
+        key = (blog, str(post_id))
+        now = time.monotonic()
+        with self._post_cache_lock:
+            cached = self._post_cache.get(key)
+            if cached is not None and now - cached[0] < POST_CACHE_TTL:
+                self._post_cache.move_to_end(key)
+                return cached[1]
+        post = self._get(
+            f"{BLOG_URL}/{_quote_blog(blog)}/posts/{post_id}",
+            params={"post_format": "npf"},
+        )
+        with self._post_cache_lock:
+            self._post_cache[key] = (now, post)
+            self._post_cache.move_to_end(key)
+            if len(self._post_cache) > POST_CACHE_SIZE:
+                self._post_cache.popitem(last=False)
+        return post
 
-    def _delete(self, url: str, params: Mapping = mapping):
-        request = requests.delete(url=url, auth=self._auth, params=params)
-        request.raise_for_status()
-        return request.json()
+    def invalidate_post(self, post_id: str | int, blog: str):
+        """
+        Discards any cached copy of a post so the next lookup (e.g. when
+        reblogging it or fetching its poll results) retrieves it again.
+
+        :param post_id: The ID of the post
+        :param blog: The blog name of the blog that made the post
+        """
+        with self._post_cache_lock:
+            self._post_cache.pop((blog, str(post_id)), None)
+
+    def _get(self, url: str, params: Mapping = None, revalidate=False):
+        return _loads(self._get_content(url, params, revalidate))
+
+    def _delete(self, url: str, params: Mapping = None):
+        request = self._session.delete(url, params=params)
+        if request.status_code >= 400:
+            request.raise_for_status()
+        return _loads(request.content)
 
     def _put(self, url: str, params=None, files=None):
         params = {} if params is None else params
         if files is not None:
-            content = StringIO(json.dumps(params))
-            files = {"json": (None, content, "application/json"), **files}
-            request = requests.put(url=url, auth=self._auth, files=files)
+            request = self._send_multipart("PUT", url, params, files)
         else:
-            request = requests.put(url=url, auth=self._auth, params=params)
-        request.raise_for_status()
-        return request.json()
+            request = self._session.put(url, params=params)
+        if request.status_code >= 400:
+            request.raise_for_status()
+        return _loads(request.content)
+
+    def _get_raw(self, url: str, params: Mapping = None, revalidate=False):
+        return self._get_content(url, params, revalidate)
 
-    def _get_raw(self, url: str, params: Mapping = mapping):
-        request = requests.get(url=url, auth=self._auth, params=params)
-        request.raise_for_status()
+    def _get_raw_into(
+          self,
+          url: str,
+          fp: BinaryIO,
+          params: Mapping = None,
+          chunk_size: int = STREAM_CHUNK_SIZE,
+    ) -> int:
+        """
+        Streams the body of a GET request into fp in chunks of chunk_size
+        bytes, bypassing the response cache, and returns the number of
+        bytes written.
+        """
+        written = 0
+        with self._session.get(url, params=params, stream=True) as request:
+            if request.status_code >= 400:
+                request.raise_for_status()
+            for chunk in request.iter_content(chunk_size):
+                fp.write(chunk)
+                written += len(chunk)
+        return written
+
+    def _get_content(
+          self, url: str, params: Mapping = None, revalidate: bool = False,
+    ) -> bytes:
+        """
+        Retrieves the body of a GET request. With revalidate, bodies sent
+        with an ETag or Last-Modified validator are cached (the
+        RESPONSE_CACHE_SIZE most recently used are kept) and later requests
+        for the same URL and parameters are made conditional, reusing the
+        cached body on a 304. Only endpoints that rarely change should ask
+        for this.
+        """
+        key = _cache_key(url, params) if revalidate else None
+        if key is None:
+            request = self._session.get(url, params=params)
+            if request.status_code >= 400:
+                request.raise_for_status()
+            return request.content
+        with self._response_cache_lock:
+            cached = self._response_cache.get(key)
+        headers = {}
+        if cached is not None:
+            etag, last_modified, _ = cached
+            if etag is not None:
+                headers["If-None-Match"] = etag
+            if last_modified is not None:
+                headers["If-Modified-Since"] = last_modified
+        request = self._session.get(url, params=params, headers=headers)
+        if cached is not None and request.status_code == 304:
+            with self._response_cache_lock:
+                if key in self._response_cache:
+                    self._response_cache.move_to_end(key)
+            return cached[2]
+        if request.status_code >= 400:
+            request.raise_for_status()
+        etag = request.headers.get("ETag")
+        last_modified = request.headers.get("Last-Modified")
+        if etag is not None or last_modified is not None:
+            with self._response_cache_lock:
+                self._response_cache[key] = (
+                    etag, last_modified, request.content,
+                )
+                self._response_cache.move_to_end(key)
+                if len(self._response_cache) > RESPONSE_CACHE_SIZE:
+                    self._response_cache.popitem(last=False)
         return request.content
 
     def _post(self, url: str, body=None, files=None):
         body = {} if body is None else body
         if files is not None:
-            content = StringIO(json.dumps(body))
-            files = {"json": (None, content, "application/json"), **files}
-            request = requests.post(url=url, auth=self._auth, files=files)
+            request = self._send_multipart("POST", url, body, files)
         else:
-            request = requests.post(url=url, auth=self._auth, json=body)
-        request.raise_for_status()
-        return request.json()
+            request = self._session.post(
+                url, data=_dumps(body), headers=_JSON_HEADERS,
+            )
+        if request.status_code >= 400:
+            request.raise_for_status()
+        return _loads(request.content)
+
+    def _send_multipart(self, method: str, url: str, body, files):
+        """
+        Sends body as the JSON part of a multipart request alongside files.
+        With requests-toolbelt installed, POST requests are streamed from the
+        open files rather than assembled in memory first. Other methods are
+        buffered: the session retries them, and a partly consumed stream
+        cannot be rewound to resend the body. POST is never retried after
+        its body has been sent.
+        """
+        parts = {"json": (None, _dumps(body), "application/json"), **files}
+        if MultipartEncoder is None or method != "POST":
+            return self._session.request(method, url, files=parts)
+        encoder = MultipartEncoder(fields=parts)
+        return self._session.request(
+            method, url,
+            data=encoder,
+            headers={"Content-Type": encoder.content_type},
+        )
 
 
 class User(Tumblr):
@@ -156,7 +346,7 @@ class User(Tumblr):
 
         See: https://www.tumblr.com/docs/en/api/v2#userinfo--get-a-users-information
         """
-        return self._get(url=f"{USER_URL}/info")
+        return self._get(f"{USER_URL}/info", revalidate=True)
 
     def limits(self):
         """
@@ -235,7 +425,7 @@ class User(Tumblr):
         :param post_id: The ID of the post to like
         :param from_blog: The blog name of the blog that made the post
         """
-        parent_post = self.get_post(post_id, from_blog)
+        parent_post = self._get_post_cached(post_id, from_blog)
         return self._post(
             f"{USER_URL}/like",
             body={
@@ -253,7 +443,7 @@ class User(Tumblr):
         :param post_id: The ID of the post to like
         :param from_blog: The blog name of the blog that made the post
         """
-        parent_post = self.get_post(post_id, from_blog)
+        parent_post = self._get_post_cached(post_id, from_blog)
         return self._post(
             f"{USER_URL}/unlike",
             body={
@@ -271,7 +461,7 @@ class User(Tumblr):
         .. seealso::
             https://help.tumblr.com/hc/en-us/articles/115015814708-Tag-and-Post-Content-Filtering
         """
-        return self._get(f"{USER_URL}/filtered_tags")
+        return self._get(f"{USER_URL}/filtered_tags", revalidate=True)
 
     def add_filtered_tags(self, tags: list[str]):
         """
@@ -311,7 +501,7 @@ class User(Tumblr):
         .. seealso::
             https://help.tumblr.com/hc/en-us/articles/115015814708-Tag-and-Post-Content-Filtering
         """
-        return self._get(f"{USER_URL}/filtered_content")
+        return self._get(f"{USER_URL}/filtered_content", revalidate=True)
 
     def add_filtered_content(self, filtered_content: str | list[str]):
         """
@@ -359,7 +549,7 @@ class User(Tumblr):
         :param post_format: The format to retrieve content: npf or legacy
         """
         return self._get(
-            url=f"{BLOG_URL}/{from_blog}/posts/{post_id}",
+            f"{BLOG_URL}/{_quote_blog(from_blog)}/posts/{post_id}",
             params={"post_format": post_format},
         )
 
@@ -420,6 +610,35 @@ class Blog(Tumblr):
         super().__init__(client_key, client_secret, oauth_key, oauth_secret)
         self.blog = blog
 
+    @property
+    def blog(self) -> str:
+        """The name of the blog (one you have auth for)"""
+        return self._blog
+
+    @blog.setter
+    def blog(self, blog: str):
+        self._blog = blog
+        self._blog_url = blog_url = f"{BLOG_URL}/{_quote_blog(blog)}"
+        self._info_url = f"{blog_url}/info"
+        self._avatar_url = f"{blog_url}/avatar/{{}}"
+        self._blocks_url = f"{blog_url}/blocks"
+        self._bulk_blocks_url = f"{blog_url}/blocks/bulk"
+        self._likes_url = f"{blog_url}/likes"
+        self._following_url = f"{blog_url}/following"
+        self._followers_url = f"{blog_url}/followers"
+        self._followed_by_url = f"{blog_url}/followed_by"
+        self._notifications_url = f"{blog_url}/notifications"
+        self._posts_url = f"{blog_url}/posts"
+        self._post_url = f"{blog_url}/posts/{{}}"
+        self._queue_url = f"{blog_url}/posts/queue"
+        self._reorder_queue_url = f"{blog_url}/posts/queue/reorder"
+        self._shuffle_queue_url = f"{blog_url}/posts/queue/shuffle"
+        self._drafts_url = f"{blog_url}/posts/draft"
+        self._submissions_url = f"{blog_url}/posts/submission"
+        self._delete_url = f"{blog_url}/post/delete"
+        self._notes_url = f"{blog_url}/notes"
+        self._mute_url = f"{blog_url}/posts/{{}}/mute"
+
     def info(self, fields: Iterable[str] = ()) -> StrMap:
         """
         Retrieves information about the blog
@@ -432,8 +651,9 @@ class Blog(Tumblr):
         :raises HTTPError: if the request fails
         """
         return self._get(
-            url=f"{BLOG_URL}/{self.blog}/info",
+            self._info_url,
             params=blog_fields(fields),
+            revalidate=True,
         )
 
     def avatar(self, size: int = 64) -> bytes:
@@ -448,7 +668,23 @@ class Blog(Tumblr):
 
         :raises HTTPError: if the request fails
         """
-        return self._get_raw(url=f"{BLOG_URL}/{self.blog}/avatar/{size}")
+        return self._get_raw(self._avatar_url.format(size), revalidate=True)
+
+    def avatar_into(self, fp: BinaryIO, size: int = 64) -> int:
+        """
+        Streams the blog's avatar into a writable binary file object, such
+        as an open file, without holding the whole image in memory.
+
+        See: https://www.tumblr.com/docs/en/api/v2#avatar--retrieve-a-blog-avatar
+
+        :param fp: The binary file object to write the image to
+        :param size: The nxn size of the image to download. Must be one of:
+            16, 24, 30, 40, 48, 64, 96, 128, 512
+        :return: The number of bytes written
+
+        :raises HTTPError: if the request fails
+        """
+        return self._get_raw_into(self._avatar_url.format(size), fp)
 
     def blocks(
           self, offset: int = 0, limit: int = 20, fields: Iterable[str] = (),
@@ -467,7 +703,7 @@ class Blog(Tumblr):
         :raises HTTPError: if the request fails
         """
         return self._get(
-            url=f"{BLOG_URL}/{self.blog}/blocks",
+            self._blocks_url,
             params={"offset": offset, "limit": limit, **blog_fields(fields)},
         )
 
@@ -483,13 +719,12 @@ class Blog(Tumblr):
 
         :raises HTTPError: if the request fails
         """
-        params = {"blocked_tumblelog": tumblelog, "post_id": post_id}
-        params = {k: v for k, v in params.items() if v is not None}
+        params = _drop_none(blocked_tumblelog=tumblelog, post_id=post_id)
         if len(params) != 1:
             raise ValueError(
                 "Exactly one of tumblelog or post_id must be given"
             )
-        return self._post(url=f"{BLOG_URL}/{self.blog}/blocks", body=params)
+        return self._post(self._blocks_url, body=params)
 
     def bulk_block(self, tumblelogs: Iterable, force: bool = False) -> StrMap:
         """
@@ -505,7 +740,7 @@ class Blog(Tumblr):
         :raises HTTPError: if the request fails
         """
         return self._post(
-            url=f"{BLOG_URL}/{self.blog}/blocks/bulk",
+            self._bulk_blocks_url,
             body={"blocked_tumblelogs": ",".join(tumblelogs), "force": force}
         )
 
@@ -522,11 +757,12 @@ class Blog(Tumblr):
 
         :raises HTTPError: if the request fails
         """
-        params = {"blocked_tumblelog": tumblelog, "anonymous_only": anonymous}
-        params = {k: v for k, v in params.items() if v is not None}
+        params = _drop_none(
+            blocked_tumblelog=tumblelog, anonymous_only=anonymous,
+        )
         if len(params) != 1:
             raise ValueError("One of tumblelog or anonymous must be given")
-        return self._delete(url=f"{BLOG_URL}/{self.blog}/blocks", params=params)
+        return self._delete(self._blocks_url, params=params)
 
     def likes(
           self,
@@ -550,12 +786,40 @@ class Blog(Tumblr):
 
         :raises HTTPError: if the request fails
         """
-        params = {"limit": limit, "offset": offset,
-                  "before": before, "after": after}
-        params = {k: v for k, v in params.items() if v is not None}
         return self._get(
-            url=f"{BLOG_URL}/{self.blog}/likes",
-            params=params | blog_fields(fields),
+            self._likes_url,
+            params=_drop_none(
+                limit=limit, offset=offset, before=before, after=after,
+                **blog_fields(fields),
+            ),
+        )
+
+    def iter_likes(
+          self,
+          page_size: int = 20,
+          prefetch: int = 2,
+          fields: Iterable[str] = (),
+    ) -> Iterator[StrMap]:
+        """
+        Iterates over all of this blog's likes, requesting up to prefetch
+        pages ahead of the one being consumed.
+
+        .. note::
+            Tumblr only pages through the first 1000 likes by offset
+
+        :param page_size: the number of likes to request per page
+            (between 1–20)
+        :param prefetch: the maximum number of page requests in flight
+        :param fields: the blog fields to retrieve with each request
+        :return: An iterator of liked posts
+
+        :raises ValueError: if page_size is not between 1 and 20
+        :raises HTTPError: if a request fails
+        """
+        fields = tuple(fields)
+        return _paginate(
+            lambda offset, limit: self.likes(limit, offset, fields=fields),
+            "liked_posts", "liked_count", page_size, prefetch,
         )
 
     def following(
@@ -574,7 +838,7 @@ class Blog(Tumblr):
         :raises HTTPError: if the request fails
         """
         return self._get(
-            url=f"{BLOG_URL}/{self.blog}/following",
+            self._following_url,
             params={"limit": limit, "offset": offset, **blog_fields(fields)},
         )
 
@@ -591,8 +855,29 @@ class Blog(Tumblr):
         :raises HTTPError: if the request fails
         """
         return self._get(
-            url=f"{BLOG_URL}/{self.blog}/followers",
+            self._followers_url,
             params={"limit": limit, "offset": offset},
+            revalidate=True,
+        )
+
+    def iter_followers(
+          self, page_size: int = 20, prefetch: int = 2,
+    ) -> Iterator[StrMap]:
+        """
+        Iterates over all users following this blog, requesting up to
+        prefetch pages ahead of the one being consumed.
+
+        :param page_size: the number of users to request per page
+            (between 1–20)
+        :param prefetch: the maximum number of page requests in flight
+        :return: An iterator of follower user objects
+
+        :raises ValueError: if page_size is not between 1 and 20
+        :raises HTTPError: if a request fails
+        """
+        return _paginate(
+            lambda offset, limit: self.followers(limit, offset),
+            "users", "total_users", page_size, prefetch,
         )
 
     def followed_by(self, blog: str):
@@ -607,7 +892,7 @@ class Blog(Tumblr):
         :raises HTTPError: if the request fails
         """
         return self._get(
-            url=f"{BLOG_URL}/{self.blog}/followed_by",
+            self._followed_by_url,
             params={"query": blog},
         )
 
@@ -626,9 +911,9 @@ class Blog(Tumblr):
 
         :raises HTTPError: if the request fails
         """
-        fmt = {"npf": True} if post_format == "npf" else {"filter": post_format}
+        fmt = _NPF_FORMAT if post_format == "npf" else {"filter": post_format}
         return self._get(
-            url=f"{BLOG_URL}/{self.blog}/posts/queue",
+            self._queue_url,
             params={"offset": offset, "limit": limit, **fmt},
         )
 
@@ -647,7 +932,7 @@ class Blog(Tumblr):
         :raises HTTPError: if the request fails
         """
         return self._post(
-            url=f"{BLOG_URL}/{self.blog}/posts/queue/reorder",
+            self._reorder_queue_url,
             body={"post_id": post_id, "insert_after": insert_after}
         )
 
@@ -661,7 +946,7 @@ class Blog(Tumblr):
 
         :raises HTTPError: if the request fails
         """
-        return self._post(url=f"{BLOG_URL}/{self.blog}/posts/queue/shuffle")
+        return self._post(self._shuffle_queue_url)
 
     def posts(
           self,
@@ -696,16 +981,38 @@ class Blog(Tumblr):
 
         :raises HTTPError: if the request fails
         """
-        params = {
-            "post_type": post_type, "post_id": post_id, "tag": tag,
-            "limit": limit, "offset": offset, "reblog_info": reblog_info,
-            "notes_info": notes_info, "before": before,
-        }
-        params = {k: v for k, v in params.items() if v is not None}
-        fmt = {"npf": True} if post_format == "npf" else {"filter": post_format}
+        fmt = _NPF_FORMAT if post_format == "npf" else {"filter": post_format}
         return self._get(
-            url=f"{BLOG_URL}/{self.blog}/posts",
-            params=params | fmt | blog_fields(fields),
+            self._posts_url,
+            params=_drop_none(
+                post_type=post_type, post_id=post_id, tag=tag, limit=limit,
+                offset=offset, reblog_info=reblog_info, notes_info=notes_info,
+                before=before, **fmt, **blog_fields(fields),
+            ),
+        )
+
+    def iter_posts(
+          self, page_size: int = 20, prefetch: int = 2, **kwargs,
+    ) -> Iterator[StrMap]:
+        """
+        Iterates over all published posts, requesting up to prefetch pages
+        ahead of the one being consumed.
+
+        :param page_size: the number of posts to request per page
+            (between 1–20)
+        :param prefetch: the maximum number of page requests in flight
+        :param kwargs: any other arguments accepted by :meth:`posts`
+            (except limit and offset)
+        :return: An iterator of posts
+
+        :raises ValueError: if page_size is not between 1 and 20
+        :raises HTTPError: if a request fails
+        """
+        return _paginate(
+            lambda offset, limit: self.posts(
+                limit=limit, offset=offset, **kwargs,
+            ),
+            "posts", "total_posts", page_size, prefetch,
         )
 
     def drafts(
@@ -726,10 +1033,10 @@ class Blog(Tumblr):
 
         :raises HTTPError: if the request fails
         """
-        fmt = {"npf": True} if post_format == "npf" else {"filter": post_format}
+        fmt = _NPF_FORMAT if post_format == "npf" else {"filter": post_format}
         return self._get(
-            url=f"{BLOG_URL}/{self.blog}/posts/draft",
-            params={"before_id": before_id} | fmt | blog_fields(fields)
+            self._drafts_url,
+            params={"before_id": before_id, **fmt, **blog_fields(fields)},
         )
 
     def submissions(
@@ -750,10 +1057,10 @@ class Blog(Tumblr):
 
         :raises HTTPError: if the request fails
         """
-        fmt = {"npf": True} if post_format == "npf" else {"filter": post_format}
+        fmt = _NPF_FORMAT if post_format == "npf" else {"filter": post_format}
         return self._get(
-            url=f"{BLOG_URL}/{self.blog}/posts/submission",
-            params={"offset": offset} | fmt | blog_fields(fields)
+            self._submissions_url,
+            params={"offset": offset, **fmt, **blog_fields(fields)},
         )
 
     def notifications(
@@ -776,12 +1083,12 @@ class Blog(Tumblr):
 
         :raises HTTPError: if the request fails
         """
-        params = {"before": before, "types": types,
-                  "rollups": rollups, "omit_post_ids": omit_post_ids}
-        params = {k: v for k, v in params.items() if v is not None}
         return self._get(
-            url=f"{BLOG_URL}/{self.blog}/notifications",
-            params=params,
+            self._notifications_url,
+            params=_drop_none(
+                before=before, types=types,
+                rollups=rollups, omit_post_ids=omit_post_ids,
+            ),
         )
 
     def get_post(
@@ -800,10 +1107,11 @@ class Blog(Tumblr):
 
         :raises HTTPError: if the request fails
         """
-        return self._get(
-            url=f"{BLOG_URL}/{from_blog or self.blog}/posts/{post_id}",
-            params={"post_format": post_format},
-        )
+        if from_blog is None:
+            url = self._post_url.format(post_id)
+        else:
+            url = f"{BLOG_URL}/{_quote_blog(from_blog)}/posts/{post_id}"
+        return self._get(url, params={"post_format": post_format})
 
     def post(
           self,
@@ -829,7 +1137,8 @@ class Blog(Tumblr):
         :param publish_on: if the publish-state is "queue", will use this
             ISO 8601 format timestamp as the publish date
         :param date: the ISO 8601 format datetime to backdate the post
-        :param tags: an iterable of tags to give the post
+        :param tags: an iterable of tags to give the post (or a string of
+            comma separated tags)
         :param source_url: a source attribution for the post content
         :param send_to_twitter: whether to share this post to a connected
             Twitter account
@@ -843,24 +1152,21 @@ class Blog(Tumblr):
         :raises HTTPError: if the request fails
         """
         content = _process_blocks(content)
-        params = {
-            "content": content.blocks,
-            "layout": content.layout,
-            "state": state,
-            "publish_on": publish_on,
-            "date": date,
-            "tags": ", ".join(tags),
-            "source_url": source_url,
-            "send_to_twitter": send_to_twitter,
-            "is_private": is_private,
-            "slug": slug,
-            "interactability_reblog": interactability_reblog,
-        }
-        return self._post(
-            url=f"{BLOG_URL}/{self.blog}/posts",
-            body={k: v for k, v in params.items() if v is not None},
-            files=content.files,
+        body = _drop_none(
+            content=content.blocks,
+            layout=content.layout,
+            state=state,
+            publish_on=publish_on,
+            date=date,
+            tags=_join_tags(tags),
+            source_url=source_url,
+            send_to_twitter=send_to_twitter,
+            is_private=is_private,
+            slug=slug,
+            interactability_reblog=interactability_reblog,
         )
+        with content.open_files() as files:
+            return self._post(self._posts_url, body=body, files=files)
 
     def reblog(
           self,
@@ -890,7 +1196,8 @@ class Blog(Tumblr):
         :param publish_on: if the publish-state is "queue", will use this
             ISO 8601 format timestamp as the publish date
         :param date: the ISO 8601 format datetime to backdate the post
-        :param tags: an iterable of tags to give the post
+        :param tags: an iterable of tags to give the post (or a string of
+            comma separated tags)
         :param source_url: a source attribution for the post content
         :param send_to_twitter: whether to share this post to a connected
             Twitter account
@@ -903,29 +1210,27 @@ class Blog(Tumblr):
 
         :raises HTTPError: if the request fails
         """
-        parent_post = self.get_post(from_id, from_blog)
+        parent = self._get_post_cached(from_id, from_blog or self.blog)
+        parent = parent["response"]
         content = _process_blocks(content)
-        params = {
-            "content": content.blocks,
-            "layout": content.layout,
-            "parent_tumblelog_uuid": parent_post["response"]["tumblelog_uuid"],
-            "reblog_key": parent_post["response"]["reblog_key"],
-            "parent_post_id": int(from_id),
-            "state": state,
-            "publish_on": publish_on,
-            "date": date,
-            "tags": ", ".join(tags),
-            "source_url": source_url,
-            "send_to_twitter": send_to_twitter,
-            "is_private": is_private,
-            "slug": slug,
-            "interactability_reblog": interactability_reblog,
-        }
-        return self._post(
-            url=f"{BLOG_URL}/{self.blog}/posts",
-            body={k: v for k, v in params.items() if v is not None},
-            files=content.files,
+        body = _drop_none(
+            content=content.blocks,
+            layout=content.layout,
+            parent_tumblelog_uuid=parent["tumblelog_uuid"],
+            reblog_key=parent["reblog_key"],
+            parent_post_id=int(from_id),
+            state=state,
+            publish_on=publish_on,
+            date=date,
+            tags=_join_tags(tags),
+            source_url=source_url,
+            send_to_twitter=send_to_twitter,
+            is_private=is_private,
+            slug=slug,
+            interactability_reblog=interactability_reblog,
         )
+        with content.open_files() as files:
+            return self._post(self._posts_url, body=body, files=files)
 
     # TODO – figure out what is going on with this
     def edit_post(
@@ -954,7 +1259,8 @@ class Blog(Tumblr):
         :param publish_on: if the publish-state is "queue", will use this
             ISO 8601 format timestamp as the publish date
         :param date: the ISO 8601 format datetime to backdate the post
-        :param tags: an iterable of tags to give the post
+        :param tags: an iterable of tags to give the post (or a string of
+            comma separated tags)
         :param source_url: a source attribution for the post content
         :param send_to_twitter: whether to share this post to a connected
             Twitter account
@@ -967,9 +1273,9 @@ class Blog(Tumblr):
 
         :raises HTTPError: if the request fails
         """
-        post = self.get_post(post_id)["response"]
+        post = self._get_post_cached(post_id, self.blog)["response"]
         content = _process_blocks(content) if content is not None else None
-        params = {
+        edits = {
             "content": content.blocks if content else None,
             "layout": content.layout if content else None,
             "parent_tumblelog_uuid": post.get("tumblelog_uuid"),
@@ -978,22 +1284,31 @@ class Blog(Tumblr):
             "state": state,
             "publish_on": publish_on,
             "date": date,
-            "tags": ", ".join(tags) if tags else None,
+            "tags": _join_tags(tags),
             "source_url": source_url,
             "send_to_twitter": send_to_twitter,
             "is_private": is_private,
             "slug": slug,
             "interactability_reblog": interactability_reblog,
         }
-        post = {**post, "tags": ", ".join(post["tags"])}
-        params = {k: v for k, v in params.items() if k in post}
-        post = {k: v for k, v in post.items() if k in params}
-        params = {k: v for k, v in params.items() if v is not None}
-        return self._put(
-            url=f"{BLOG_URL}/{self.blog}/posts/{post_id}",
-            params=post | params,
-            files=content.files if content else None
-        )
+        # Only fields the post already has are sent, edited or not
+        params = {
+            key: post[key] if value is None else value
+            for key, value in edits.items()
+            if key in post
+        }
+        post_tags = params.get("tags")
+        if edits["tags"] is None and isinstance(post_tags, (list, tuple)):
+            params["tags"] = ", ".join(post_tags)
+        try:
+            with content.open_files() if content else nullcontext() as files:
+                return self._put(
+                    self._post_url.format(post_id),
+                    params=params,
+                    files=files,
+                )
+        finally:
+            self.invalidate_post(post_id)
 
     def delete_post(self, post_id: str | int) -> StrMap:
         """
@@ -1006,10 +1321,24 @@ class Blog(Tumblr):
 
         :raises HTTPError: if the request fails
         """
-        return self._delete(
-            url=f"{BLOG_URL}/{self.blog}/post/delete",
-            params={"id": post_id},
-        )
+        try:
+            return self._delete(
+                self._delete_url,
+                params={"id": post_id},
+            )
+        finally:
+            self.invalidate_post(post_id)
+
+    def invalidate_post(self, post_id: str | int, blog: str = None):
+        """
+        Discards any cached copy of a post so the next lookup (e.g. when
+        reblogging or editing it) retrieves it again.
+
+        :param post_id: The ID of the post
+        :param blog: The blog name of the blog that made the post
+            (the current blog if not provided)
+        """
+        super().invalidate_post(post_id, blog or self.blog)
 
     def mute_post(
           self,
@@ -1029,7 +1358,7 @@ class Blog(Tumblr):
         :raises HTTPError: if the request fails
         """
         return self._post(
-            url=f"{BLOG_URL}/{self.blog}/posts/{post_id}/mute",
+            self._mute_url.format(post_id),
             body={"mute_length_seconds": mute_length_seconds},
         )
 
@@ -1044,7 +1373,7 @@ class Blog(Tumblr):
 
         :raises HTTPError: if the request fails
         """
-        return self._delete(url=f"{BLOG_URL}/{self.blog}/posts/{post_id}/mute")
+        return self._delete(self._mute_url.format(post_id))
 
     def notes(
           self, post_id: str | int, before: int = None, mode: str = "all",
@@ -1062,7 +1391,7 @@ class Blog(Tumblr):
         :raises HTTPError: if the request fails
         """
         return self._get(
-            url=f"{BLOG_URL}/{self.blog}/notes",
+            self._notes_url,
             params={"id": post_id, "before_timestamp": before, "mode": mode}
         )
 
@@ -1084,11 +1413,9 @@ class Blog(Tumblr):
         """
         if blog is None:
             blog = self.blog
-        poll = get_polls_from_post(self.get_post(post_id, from_blog=blog))
+        poll = get_polls_from_post(self._get_post_cached(post_id, blog))
         poll_id = poll["client_id"]
-        results = self._get(
-            f"{BASE_URL}/polls/{blog}/{post_id}/{poll_id}/results"
-        )
+        results = self.raw_poll_results(post_id, poll_id, blog)
         return zip_poll_with_results(poll, results)
 
     def raw_poll_results(
@@ -1109,10 +1436,8 @@ class Blog(Tumblr):
 
         :raises HTTPError: if the request fails
         """
-        if blog is None:
-            blog = self.blog
-        url = f"{BASE_URL}/polls/{blog}/{post_id}/{poll_id}/results"
-        return self._get(url)
+        blog = _quote_blog(self.blog if blog is None else blog)
+        return self._get(f"{BASE_URL}/polls/{blog}/{post_id}/{poll_id}/results")
 
 
 def zip_poll_with_results(
@@ -1133,12 +1458,14 @@ def zip_poll_with_results(
     if "response" in results:
         results = results["response"]
     results = results["results"]
-    poll = {**deepcopy(poll)}
-    for answer in poll["answers"]:
-        vote = results[answer["client_id"]]
-        answer["votes"] = vote
-    poll["total_votes"] = sum(results.values())
-    return poll
+    return {
+        **poll,
+        "answers": [
+            {**answer, "votes": results[answer["client_id"]]}
+            for answer in poll["answers"]
+        ],
+        "total_votes": sum(results.values()),
+    }
 
 
 def get_polls_from_post(post: Mapping) -> Mapping[str, Any] | None:
@@ -1149,56 +1476,232 @@ def get_polls_from_post(post: Mapping) -> Mapping[str, Any] | None:
     however, these are few and far between and cannot be posted any more.
 
     :param post: The content of the post or the response from getting a post
-    :return: An iterator of the poll block mappings
+    :return: The first poll block mapping, or None if there is no poll
     """
-    if "response" in post:
-        post = post["response"]
-    for block in post["content"]:
-        if block["type"] == "poll":
-            return block
+    return _first_block(post, "poll")
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class _Content:
-    blocks: Iterable[Mapping]
-    layout: list[Mapping]
-    files: Mapping
+    blocks: Sequence[dict]
+    layout: Sequence[dict]
+    uploads: Sequence[DataBlock]
+
+    @contextmanager
+    def open_files(self) -> Iterator[dict]:
+        """
+        Opens the files of all uploads, yielding them in the mapping form
+        requests expects, and closes them again when the context exits.
+        """
+        with ExitStack() as stack:
+            files = {}
+            for upload in self.uploads:
+                opened = upload.file()
+                for _, file, _ in opened.values():
+                    stack.callback(file.close)
+                files.update(opened)
+            yield files
+
+
+_EMPTY_CONTENT = _Content(blocks=(), layout=(), uploads=())
+
+
+def _content_data(block: ContentBlock, uploads: list) -> list[dict]:
+    return [block.data()]
+
+
+def _multi_data(block: MultiBlock, uploads: list) -> list[dict]:
+    return block.data()
+
+
+def _upload_data(block: DataBlock, uploads: list) -> list[dict]:
+    uploads.append(block)
+    return [block.data()]
+
+
+def _row_data(block: Row, uploads: list) -> list[dict]:
+    uploads.extend(block.images)
+    return [image.data() for image in block.images]
+
+
+_BLOCK_HANDLERS = {
+    ContentBlock: _content_data,
+    MultiBlock: _multi_data,
+    DataBlock: _upload_data,
+    Row: _row_data,
+}
+
+
+@cache
+def _block_handler(block_type: type) -> Callable | None:
+    """
+    Finds the handler for a block type by walking its MRO, so subclasses
+    of the handled blocks resolve to their base's handler. Returns None
+    for blocks that produce no content (e.g. ReadMore).
+    """
+    for cls in block_type.__mro__:
+        if cls in _BLOCK_HANDLERS:
+            return _BLOCK_HANDLERS[cls]
+    return None
 
 
 def _process_blocks(blocks: Iterable[Block]) -> _Content:
+    if isinstance(blocks, Sequence) and not blocks:
+        return _EMPTY_CONTENT
     block_data = []
-    layout = {"type": "rows", "display": []}
-    files = {}
+    display = []
+    layout = {"type": "rows", "display": display}
+    uploads = []
+    count = 0
     for block in blocks:
-        new_blocks = []
-        match block:
-            case ContentBlock() as content:
-                new_blocks = [content.data()]
-            case MultiBlock() as multi:
-                new_blocks = [b.data for b in multi.data]
-            case DataBlock() as data:
-                new_blocks = [data.data()]
-                files |= data.file()
-            case ReadMore():
-                layout["truncate_after"] = len(block_data) - 1
-            case Row(images=images):
-                for image in images:
-                    new_blocks.append(image.data())
-                    files |= image.file()
+        handler = _block_handler(type(block))
+        if handler is None:
+            if isinstance(block, ReadMore):
+                layout["truncate_after"] = count - 1
+            continue
+        new_blocks = handler(block, uploads)
         if new_blocks:
-            block_layout = [i + len(block_data) for i in range(len(new_blocks))]
-            layout["display"].append({"blocks": block_layout})
+            end = count + len(new_blocks)
+            display.append({"blocks": list(range(count, end))})
             block_data.extend(new_blocks)
+            count = end
+    # One block per row in order is how Tumblr lays out posts by default,
+    # so the layout can be left out unless rows are merged or truncated
+    if "truncate_after" not in layout and len(display) == count:
+        return _Content(blocks=block_data, layout=[], uploads=uploads)
     return _Content(
         blocks=block_data,
         layout=[layout],
-        files=files,
+        uploads=uploads,
     )
 
 
+def _first_block(post: Mapping, block_type: str) -> StrMap | None:
+    """
+    The first content block of the given type in a post (or the response
+    from getting a post), or None if it has no such block
+    """
+    if "response" in post:
+        post = post["response"]
+    return next(
+        (block for block in post["content"] if block["type"] == block_type),
+        None,
+    )
+
+
+def _paginate(
+      fetch: Callable[[int, int], StrMap],
+      key: str,
+      total_key: str,
+      page_size: int,
+      prefetch: int,
+) -> Iterator[StrMap]:
+    """
+    Yields the items listed under key in the responses of
+    fetch(offset, limit) for successive offsets until an empty page is
+    returned or the offset reaches the count under total_key. Short pages
+    before then do not end iteration, as Tumblr may filter posts out of a
+    page. Up to prefetch pages are requested concurrently ahead of the page
+    being yielded; outstanding requests are cancelled if the iterator is
+    closed early.
+
+    :raises ValueError: if page_size is not between 1 and MAX_PAGE_SIZE
+    """
+    if not 1 <= page_size <= MAX_PAGE_SIZE:
+        raise ValueError(
+            f"page_size must be between 1 and {MAX_PAGE_SIZE}, "
+            f"got {page_size}"
+        )
+    return _paginate_pages(fetch, key, total_key, page_size, prefetch)
+
+
+def _paginate_pages(
+      fetch: Callable[[int, int], StrMap],
+      key: str,
+      total_key: str,
+      page_size: int,
+      prefetch: int,
+) -> Iterator[StrMap]:
+    """The generator behind :func:`_paginate`"""
+    # Imported here as only the iter_* methods need a thread pool
+    from concurrent.futures import ThreadPoolExecutor
+
+    executor = ThreadPoolExecutor(max_workers=prefetch)
+    pending = deque()
+    offset = 0
+    try:
+        while len(pending) < prefetch:
+            pending.append(executor.submit(fetch, offset, page_size))
+            offset += page_size
+        end = 0
+        while pending:
+            response = pending.popleft().result()["response"]
+            items = response[key]
+            end += page_size
+            yield from items
+            total = response.get(total_key)
+            if not items or (total is not None and end >= total):
+                return
+            pending.append(executor.submit(fetch, offset, page_size))
+            offset += page_size
+    finally:
+        executor.shutdown(wait=False, cancel_futures=True)
+
+
+def _drop_none(**kwargs) -> dict:
+    """Returns the given keyword arguments, leaving out any that are None"""
+    return {k: v for k, v in kwargs.items() if v is not None}
+
+
+def _cache_key(url: str, params: Mapping = None) -> tuple | None:
+    """
+    A hashable key for a GET request's URL and query parameters, or None
+    if a parameter value cannot be used in one
+    """
+    if not params:
+        return url, ()
+    key = url, tuple(sorted(
+        (k, tuple(v) if isinstance(v, list | tuple) else v)
+        for k, v in params.items()
+    ))
+    try:
+        hash(key)
+    except TypeError:
+        return None
+    return key
+
+
+def _quote_blog(blog: str) -> str:
+    """
+    A blog name or identifier quoted for use as a URL path segment. ":" is
+    kept so "t:<uuid>" blog identifiers pass through unchanged.
+    """
+    return quote(blog, safe=":")
+
+
+def _join_tags(tags: Iterable[str] | str) -> str | None:
+    """The comma separated tags parameter, or None if there are no tags"""
+    if not tags:
+        return None
+    return tags if isinstance(tags, str) else ", ".join(tags)
+
+
 def blog_fields(fields):
-    fields = [
+    if not fields:
+        return _NO_BLOG_FIELDS
+    return _blog_fields(tuple(fields))
+
+
+@lru_cache(maxsize=64)
+def _blog_fields(fields: tuple[str, ...]) -> StrMap:
+    """
+    The (read-only) fields[blogs] parameter for the given fields, cached
+    as the same few field selections tend to be requested repeatedly
+    """
+    if not fields:
+        return _NO_BLOG_FIELDS
+    fields = ",".join(
         f"?{field}" if field in OPTIONAL_BLOG_FIELDS else field
         for field in fields
-    ]
-    return {"fields[blogs]": ",".join(fields)} if fields else {}
+    )
+    return MappingProxyType({"fields[blogs]": fields})